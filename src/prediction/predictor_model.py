@@ -8,20 +8,129 @@ from darts.models.forecasting.rnn_model import RNNModel
 from darts import TimeSeries
 from schema.data_schema import ForecastingSchema
 from sklearn.exceptions import NotFittedError
+import torch
 from torch import cuda
-from sklearn.preprocessing import MinMaxScaler
+from pytorch_lightning import seed_everything
 from pytorch_lightning.callbacks.early_stopping import EarlyStopping
 from logger import get_logger
 
-warnings.filterwarnings("ignore")
-
 
 PREDICTOR_FILE_NAME = "predictor.joblib"
 MODEL_FILE_NAME = "model.joblib"
+PACKED_SERIES_ATTRIBUTES = ("targets_series", "training_future_covariates")
 
 logger = get_logger(task_name="model")
 
 
+def _fit_minmax(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the column-wise minimum and range used for min-max scaling.
+    Missing values are ignored and constant columns get a range of 1 so that
+    scaling does not divide by zero.
+
+    Args:
+        values (np.ndarray): 2D array of shape (time steps, features).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The minimum and range of each column.
+    """
+    mn = np.nanmin(values, axis=0)
+    mx = np.nanmax(values, axis=0)
+    rng = np.where(mx > mn, mx - mn, 1.0)
+    return mn, rng
+
+
+def _fit_minmax_segments(
+    values: np.ndarray, offsets: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the minimum and range of every segment of a concatenated 1D array
+    in a single vectorized pass.
+
+    Args:
+        values (np.ndarray): 1D array holding all series back to back.
+        offsets (np.ndarray): Start index of each series followed by the total length.
+            All segments must be non-empty.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The minimum and range of each segment.
+    """
+    starts = offsets[:-1]
+    # fmin/fmax ignore NaN so that missing values do not spoil a whole series.
+    mn = np.fmin.reduceat(values, starts)
+    mx = np.fmax.reduceat(values, starts)
+    rng = np.where(mx > mn, mx - mn, 1.0)
+    return mn, rng
+
+
+def _compile_errors() -> Tuple[type, ...]:
+    """
+    Gets the exception types raised when a torch.compile'd module fails to compile.
+
+    Returns:
+        Tuple[type, ...]: The exception types, empty if torch.compile is not available.
+    """
+    try:
+        from torch._dynamo.exc import TorchDynamoException
+    except ImportError:
+        return ()
+    return (TorchDynamoException,)
+
+
+def _pack_series(series: List[TimeSeries]) -> dict:
+    """
+    Packs a list of TimeSeries into a single concatenated float32 array so that
+    it pickles as one buffer instead of one xarray object per series.
+
+    Args:
+        series (List[TimeSeries]): The series to pack. All series must have the same components.
+
+    Returns:
+        dict: The concatenated values, the offsets of each series, the component
+            names and the static covariates of all series as one row per series
+            (None if the series have no static covariates).
+    """
+    values = [s.values(copy=False) for s in series]
+    static_covariates = None
+    if series[0].static_covariates is not None:
+        static_covariates = pd.concat(
+            [s.static_covariates for s in series], ignore_index=True
+        )
+    return {
+        "values": np.concatenate(values).astype(np.float32, copy=False),
+        "offsets": np.concatenate(([0], np.cumsum([len(v) for v in values]))),
+        "columns": list(series[0].components),
+        "static_covariates": static_covariates,
+    }
+
+
+def _unpack_series(packed: dict) -> List[TimeSeries]:
+    """
+    Rebuilds the list of TimeSeries packed by `_pack_series`.
+
+    Args:
+        packed (dict): The packed series.
+
+    Returns:
+        List[TimeSeries]: The series.
+    """
+    values = packed["values"]
+    offsets = packed["offsets"]
+    static_covariates = packed["static_covariates"]
+    return [
+        TimeSeries.from_values(
+            values[offsets[index] : offsets[index + 1]],
+            columns=packed["columns"],
+            static_covariates=(
+                static_covariates.iloc[index]
+                if static_covariates is not None
+                else None
+            ),
+        )
+        for index in range(len(offsets) - 1)
+    ]
+
+
 class Forecaster:
     """A wrapper class for the RNN Forecaster.
 
@@ -45,6 +154,7 @@ class Forecaster:
         optimizer_kwargs: Optional[dict] = None,
         use_exogenous: bool = None,
         random_state: Optional[int] = 0,
+        compile_model: bool = False,
         **kwargs,
     ):
         """Construct a new RNN Forecaster
@@ -82,6 +192,10 @@ class Forecaster:
                 If true, uses covariates for training.
 
             random_state (int): Sets the underlying random seed at model initialization time.
+
+            compile_model (bool):
+                If true, the underlying torch module is compiled with torch.compile on the first prediction.
+                Compilation is only worth its start-up cost when the same Forecaster serves repeated predictions.
         """
         self.data_schema = data_schema
         self.input_chunk_length = input_chunk_length
@@ -93,7 +207,9 @@ class Forecaster:
         self.optimizer_kwargs = optimizer_kwargs
         self.use_exogenous = use_exogenous
         self.random_state = random_state
+        self.compile_model = compile_model
         self._is_trained = False
+        self._compiled = False
         self.kwargs = kwargs
         self.history_length = None
 
@@ -118,17 +234,55 @@ class Forecaster:
 
         if cuda.is_available():
             self.pl_trainer_kwargs["accelerator"] = "gpu"
+            # Let non-cuDNN float32 matmuls (the output Linear layer) use TF32
+            # on Ampere+ GPUs; cuDNN RNN kernels follow cudnn.allow_tf32, which
+            # is already True. Note this is process-wide torch state.
+            torch.set_float32_matmul_precision("high")
+            # Training windows have a fixed length, so cuDNN can cache the
+            # fastest RNN kernels across steps.
+            torch.backends.cudnn.benchmark = True
             print("GPU training is available.")
         else:
             print("GPU training not available.")
 
         self.output_chunk_length = self.training_length - self.input_chunk_length
 
+        # Resolve the schema-dependent covariate setup once so that data
+        # preparation does not re-derive it on every call.
+        self.use_date_covariates = data_schema.time_col_dtype in ["DATE", "DATETIME"]
+        self.future_covariates_names = list(data_schema.future_covariates)
+        if self.use_date_covariates:
+            self.future_covariates_names += [
+                f"{data_schema.time_col}_year",
+                f"{data_schema.time_col}_month",
+            ]
+        self.future_covariates_names += data_schema.static_covariates
+        self.use_future_covariates = bool(
+            self.use_exogenous and self.future_covariates_names
+        )
+        self.use_static_covariates = bool(
+            self.use_exogenous and data_schema.static_covariates
+        )
+
+    def _add_date_covariates(self, data: pd.DataFrame) -> None:
+        """
+        Adds the year and month of the time column to the data as covariates.
+
+        Args:
+            data (pd.DataFrame): The data to which the columns are added.
+
+        Returns: None
+        """
+        time_col = self.data_schema.time_col
+        date_col = pd.to_datetime(data[time_col])
+        data[f"{time_col}_year"] = date_col.dt.year
+        data[f"{time_col}_month"] = date_col.dt.month
+
     def _prepare_data(
         self,
         history: pd.DataFrame,
         data_schema: ForecastingSchema,
-    ) -> Tuple[List, List, List]:
+    ) -> Tuple[List, List]:
         """
         Puts the data into the expected shape by the forecaster.
         Drops the time column and puts all the target series as columns in the dataframe.
@@ -138,110 +292,81 @@ class Forecaster:
             data_schema (ForecastingSchema): The schema of the training data.
 
         Returns:
-            Tuple[List, List, List]: Target, Past covariates and Future covariates.
+            Tuple[List, List]: Target and Future covariates.
         """
         targets = []
-        past = []
         future = []
 
-        future_covariates_names = data_schema.future_covariates
-        if data_schema.time_col_dtype in ["DATE", "DATETIME"]:
-            date_col = pd.to_datetime(history[data_schema.time_col])
-            year_col = date_col.dt.year
-            month_col = date_col.dt.month
-            year_col_name = f"{data_schema.time_col}_year"
-            month_col_name = f"{data_schema.time_col}_month"
-            history[year_col_name] = year_col
-            history[month_col_name] = month_col
-            future_covariates_names += [year_col_name, month_col_name]
-
-            year_col = date_col.dt.year
-            month_col = date_col.dt.month
-
-        groups_by_ids = history.groupby(data_schema.id_col)
-        all_ids = list(groups_by_ids.groups.keys())
-        all_series = [
-            groups_by_ids.get_group(id_).drop(columns=data_schema.id_col)
-            for id_ in all_ids
-        ]
-
-        self.all_ids = all_ids
+        future_covariates_names = self.future_covariates_names
+        if self.use_future_covariates and self.use_date_covariates:
+            self._add_date_covariates(history)
+
+        groups_by_ids = history.groupby(data_schema.id_col, sort=False, observed=True)
+        all_ids, all_series = zip(
+            *[
+                (id_, group.drop(columns=data_schema.id_col))
+                for id_, group in groups_by_ids
+            ]
+        )
+
+        if self.history_length:
+            all_series = [s.iloc[-self.history_length :] for s in all_series]
+
+        self.all_ids = list(all_ids)
+        lengths = np.array([len(s) for s in all_series])
+        offsets = np.concatenate(([0], np.cumsum(lengths)))
+        target_values = np.concatenate(
+            [s[data_schema.target].to_numpy() for s in all_series]
+        )
+        target_mn, target_rng = _fit_minmax_segments(target_values, offsets)
+        scaled_targets = (
+            (target_values - np.repeat(target_mn, lengths))
+            / np.repeat(target_rng, lengths)
+        ).astype(np.float32)
+
         scalers = {}
         for index, s in enumerate(all_series):
-            if self.history_length:
-                s = s.iloc[-self.history_length :]
-            s.reset_index(inplace=True)
-
-            past_scaler = MinMaxScaler()
-            scaler = MinMaxScaler()
-            s[data_schema.target] = scaler.fit_transform(
-                s[data_schema.target].values.reshape(-1, 1)
-            )
+            scaled_values = scaled_targets[offsets[index] : offsets[index + 1]]
 
-            scalers[index] = scaler
+            scalers[index] = (target_mn[index], target_rng[index])
             static_covariates = None
-            if self.use_exogenous and self.data_schema.static_covariates:
-                static_covariates = s[self.data_schema.static_covariates]
-
-            target = TimeSeries.from_dataframe(
-                s,
-                value_cols=data_schema.target,
-                static_covariates=(
-                    static_covariates.iloc[0] if static_covariates is not None else None
-                ),
+            if self.use_static_covariates:
+                static_covariates = s[data_schema.static_covariates].iloc[0]
+
+            target = TimeSeries.from_values(
+                scaled_values.reshape(-1, 1),
+                columns=[data_schema.target],
+                static_covariates=static_covariates,
             )
 
             targets.append(target)
 
-            if data_schema.past_covariates:
-                original_values = (
-                    s[data_schema.past_covariates].values.reshape(-1, 1)
-                    if len(data_schema.past_covariates) == 1
-                    else s[data_schema.past_covariates].values
-                )
-                s[data_schema.past_covariates] = past_scaler.fit_transform(
-                    original_values
-                )
-                past_covariates = TimeSeries.from_dataframe(
-                    s[data_schema.past_covariates]
+        future_mn = []
+        future_rng = []
+        if self.use_future_covariates:
+            for train_series in all_series:
+                original_values = train_series[future_covariates_names].to_numpy(
+                    dtype=np.float32
                 )
-                past.append(past_covariates)
-
-        future_scalers = {}
-        future_covariates_names += data_schema.static_covariates
-
-        if future_covariates_names:
-            for id, train_series in zip(all_ids, all_series):
-                if self.history_length:
-                    train_series = train_series.iloc[-self.history_length :]
-
-                future_covariates = train_series[future_covariates_names]
-
-                future_covariates.reset_index(inplace=True)
-                future_scaler = MinMaxScaler()
-                original_values = (
-                    future_covariates[future_covariates_names].values.reshape(-1, 1)
-                    if len(future_covariates_names) == 1
-                    else future_covariates[future_covariates_names].values
+                mn, rng = _fit_minmax(original_values)
+                future_covariates = TimeSeries.from_values(
+                    (original_values - mn) / rng,
+                    columns=future_covariates_names,
                 )
-                future_covariates[future_covariates_names] = (
-                    future_scaler.fit_transform(original_values)
-                )
-
-                future_covariates = TimeSeries.from_dataframe(
-                    future_covariates[future_covariates_names]
-                )
-                future_scalers[id] = future_scaler
+                future_mn.append(mn)
+                future_rng.append(rng)
                 future.append(future_covariates)
 
         self.scalers = scalers
-        self.future_scalers = future_scalers
-        if not past or not self.use_exogenous:
-            past = None
-        if not future or not self.use_exogenous:
+        # Stacked as (n_series, n_covariates) arrays indexed by series position,
+        # so that loading with mmap_mode maps two arrays instead of two per series.
+        self.future_scalers = (
+            (np.stack(future_mn), np.stack(future_rng)) if future_mn else None
+        )
+        if not future:
             future = None
 
-        return targets, past, future
+        return targets, future
 
     def _prepare_test_data(
         self,
@@ -258,59 +383,38 @@ class Forecaster:
         """
         future = []
         data_schema = self.data_schema
-        future_covariates_names = data_schema.future_covariates
-        if data_schema.time_col_dtype in ["DATE", "DATETIME"]:
-            date_col = pd.to_datetime(data[data_schema.time_col])
-            year_col = date_col.dt.year
-            month_col = date_col.dt.month
-            year_col_name = f"{data_schema.time_col}_year"
-            month_col_name = f"{data_schema.time_col}_month"
-            data[year_col_name] = year_col
-            data[month_col_name] = month_col
-            year_col = date_col.dt.year
-            month_col = date_col.dt.month
-
-        groups_by_ids = data.groupby(data_schema.id_col)
-        all_ids = list(groups_by_ids.groups.keys())
-        all_series = [
-            groups_by_ids.get_group(id_).drop(columns=data_schema.id_col)
-            for id_ in all_ids
-        ]
-
-        if future_covariates_names:
-            for id, test_series in zip(all_ids, all_series):
-                future_covariates = test_series[future_covariates_names]
-
-                future_covariates.reset_index(inplace=True)
-                future_scaler = self.future_scalers[id]
-                original_values = (
-                    future_covariates[future_covariates_names].values.reshape(-1, 1)
-                    if len(future_covariates_names) == 1
-                    else future_covariates[future_covariates_names].values
-                )
-
-                future_covariates[future_covariates_names] = future_scaler.transform(
-                    original_values
-                )
-
-                future_covariates = TimeSeries.from_dataframe(
-                    future_covariates[future_covariates_names]
-                )
-                future.append(future_covariates)
-
-        if not future or not self.use_exogenous:
-            future = None
-        else:
-            for index, (train_covariates, test_covariates) in enumerate(
-                zip(self.training_future_covariates, future)
-            ):
-                train_values = train_covariates.values()
-                test_values = test_covariates.values()
-
-                full_values = np.concatenate((train_values, test_values), axis=0)
-                full_series = TimeSeries.from_values(full_values)
+        future_covariates_names = self.future_covariates_names
+        if not self.use_future_covariates:
+            return None
+
+        if self.use_date_covariates:
+            self._add_date_covariates(data)
+
+        # Test series are aligned with the order of the training series.
+        groups_by_ids = data.groupby(data_schema.id_col, sort=False, observed=True)
+        test_groups = {
+            id_: group.drop(columns=data_schema.id_col) for id_, group in groups_by_ids
+        }
+        all_series = [test_groups[id_] for id_ in self.all_ids]
+
+        future_mn, future_rng = self.future_scalers
+        for index, (train_covariates, test_series) in enumerate(
+            zip(self.training_future_covariates, all_series)
+        ):
+            mn = future_mn[index]
+            rng = future_rng[index]
+            test_values = test_series[future_covariates_names].to_numpy(
+                dtype=np.float32
+            )
+            np.subtract(test_values, mn, out=test_values)
+            np.divide(test_values, rng, out=test_values)
 
-                future[index] = full_series
+            full_values = np.concatenate(
+                (train_covariates.values(copy=False), test_values), axis=0
+            )
+            future.append(
+                TimeSeries.from_values(full_values, columns=future_covariates_names)
+            )
 
         return future
 
@@ -363,37 +467,141 @@ class Forecaster:
             history (pandas.DataFrame): The features of the training data.
             data_schema (ForecastingSchema): The schema of the training data.
         """
-        np.random.seed(self.random_state)
-        targets, past_covariates, future_covariates = self._prepare_data(
+        seed_everything(self.random_state, workers=True)
+        targets, future_covariates = self._prepare_data(
             history=history,
             data_schema=data_schema,
         )
 
         self._validate_input_chunk_and_history_lengths(series_length=len(targets[0]))
 
-        self.model = RNNModel(
-            input_chunk_length=self.input_chunk_length,
-            model=self.model_type,
-            hidden_dim=self.hidden_dim,
-            n_rnn_layers=self.n_rnn_layers,
-            dropout=self.dropout,
-            training_length=self.training_length,
-            optimizer_kwargs=self.optimizer_kwargs,
-            pl_trainer_kwargs=self.pl_trainer_kwargs,
-            **self.kwargs,
-        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.model = RNNModel(
+                input_chunk_length=self.input_chunk_length,
+                model=self.model_type,
+                hidden_dim=self.hidden_dim,
+                n_rnn_layers=self.n_rnn_layers,
+                dropout=self.dropout,
+                training_length=self.training_length,
+                optimizer_kwargs=self.optimizer_kwargs,
+                pl_trainer_kwargs=self.pl_trainer_kwargs,
+                **self.kwargs,
+            )
 
-        self.model.fit(
-            targets,
-            future_covariates=future_covariates,
-        )
+            self.model.fit(
+                targets,
+                future_covariates=future_covariates,
+            )
 
         self._is_trained = True
         self.data_schema = data_schema
         self.targets_series = targets
-        self.past_covariates = past_covariates
         self.training_future_covariates = future_covariates
 
+    def _compile_model(self) -> None:
+        """
+        Wraps the underlying torch module with torch.compile so that repeated
+        predictions reuse the generated kernels.
+        Keeps eager execution if torch.compile is not available (PyTorch < 2.0).
+        Compilation itself happens lazily on the first forward call; failures
+        there are handled in `predict`.
+
+        Returns: None
+        """
+        try:
+            self.model.model = torch.compile(
+                self.model.model, mode="reduce-overhead", fullgraph=False
+            )
+        except Exception as exc:
+            logger.warning(f"Could not compile model, using eager mode. Error: {exc}")
+        self._compiled = True
+
+    def _uncompile_model(self) -> bool:
+        """
+        Restores the eager torch module wrapped by `_compile_model`, if any.
+
+        Returns:
+            bool: True if a compiled module was unwrapped.
+        """
+        module = self.model.model
+        if not hasattr(module, "_orig_mod") and (
+            getattr(module, "_compiler_ctx", None) is None
+        ):
+            return False
+        # Lightning patches forward/predict_step of the original module when it
+        # predicts with a compiled model, so those patches must be undone too.
+        from pytorch_lightning.utilities.compile import to_uncompiled
+
+        self.model.model = to_uncompiled(module)
+        return True
+
+    def __getstate__(self) -> dict:
+        """
+        Replaces the training TimeSeries lists with packed NumPy arrays when the
+        Forecaster is pickled. They are rebuilt on the first call to `predict`.
+
+        Returns:
+            dict: The state to pickle.
+        """
+        state = self.__dict__.copy()
+        packed_series = dict(state.get("_packed_series", {}))
+        for name in PACKED_SERIES_ATTRIBUTES:
+            series = state.pop(name, None)
+            if series:
+                packed_series[name] = _pack_series(series)
+            elif name not in packed_series:
+                state[name] = series
+        state["_packed_series"] = packed_series
+        return state
+
+    def _unpack_training_series(self) -> None:
+        """
+        Rebuilds the training TimeSeries that were packed when the Forecaster was pickled.
+
+        Returns: None
+        """
+        packed_series = self.__dict__.pop("_packed_series", {})
+        for name, packed in packed_series.items():
+            setattr(self, name, _unpack_series(packed))
+
+    def _get_prediction_positions(self, test_data: pd.DataFrame) -> np.ndarray:
+        """
+        Maps each test row to the position of its forecast step in the flattened
+        predictions, which follow the training series order. The test rows are not
+        guaranteed to follow that order.
+
+        Args:
+            test_data (pd.DataFrame): Given test input for forecasting.
+
+        Returns:
+            np.ndarray: The index of each test row's forecast value.
+        """
+        id_col = self.data_schema.id_col
+        forecast_length = self.data_schema.forecast_length
+        series_positions = test_data[id_col].map(
+            {id_: index for index, id_ in enumerate(self.all_ids)}
+        )
+        if series_positions.isna().any():
+            unknown_ids = test_data.loc[series_positions.isna(), id_col].unique()
+            raise ValueError(
+                f"Test data contains ids that are not in the training data: {list(unknown_ids)}"
+            )
+        missing_ids = set(self.all_ids).difference(test_data[id_col].unique())
+        if missing_ids:
+            raise ValueError(
+                f"Test data is missing ids that are in the training data: {list(missing_ids)}"
+            )
+
+        steps = (
+            test_data.groupby(id_col, sort=False, observed=True).cumcount().to_numpy()
+        )
+        if (steps >= forecast_length).any():
+            raise ValueError(
+                f"Test data has more rows per id than the forecast horizon ({forecast_length})."
+            )
+        return series_positions.to_numpy(dtype=np.int64) * forecast_length + steps
+
     def predict(
         self, test_data: pd.DataFrame, prediction_col_name: str
     ) -> pd.DataFrame:
@@ -408,21 +616,41 @@ class Forecaster:
         if not self._is_trained:
             raise NotFittedError("Model is not fitted yet.")
 
-        future_covariates = self._prepare_test_data(test_data)
+        row_positions = self._get_prediction_positions(test_data)
 
-        predictions = self.model.predict(
-            n=self.data_schema.forecast_length,
-            series=self.targets_series,
-            future_covariates=future_covariates,
-        )
-        prediction_values = []
+        if self.compile_model and not self._compiled:
+            self._compile_model()
+
+        self._unpack_training_series()
+        future_covariates = self._prepare_test_data(test_data)
+        forecast_length = self.data_schema.forecast_length
+
+        predict_kwargs = {
+            "n": forecast_length,
+            "series": self.targets_series,
+            "future_covariates": future_covariates,
+            "num_samples": 1,
+            "verbose": False,
+        }
+        with torch.inference_mode():
+            try:
+                predictions = self.model.predict(**predict_kwargs)
+            except _compile_errors() as exc:
+                if not self._uncompile_model():
+                    raise
+                logger.warning(
+                    f"Compiled model failed, falling back to eager mode. Error: {exc}"
+                )
+                predictions = self.model.predict(**predict_kwargs)
+        prediction_values = np.empty((len(predictions) * forecast_length, 1))
         for index, prediction in enumerate(predictions):
-            prediction = prediction.pd_dataframe()
-            values = prediction.values
-            values = self.scalers[index].inverse_transform(values)
-            prediction_values += list(values)
+            mn, rng = self.scalers[index]
+            start = index * forecast_length
+            prediction_values[start : start + forecast_length] = (
+                prediction.values() * rng + mn
+            )
 
-        test_data[prediction_col_name] = np.array(prediction_values)
+        test_data[prediction_col_name] = prediction_values.ravel()[row_positions]
         return test_data
 
     def save(self, model_dir_path: str) -> None:
@@ -433,8 +661,15 @@ class Forecaster:
         """
         if not self._is_trained:
             raise NotFittedError("Model is not fitted yet.")
+        if self._uncompile_model():
+            self._compiled = False
         self.model.save(os.path.join(model_dir_path, MODEL_FILE_NAME))
-        joblib.dump(self, os.path.join(model_dir_path, PREDICTOR_FILE_NAME))
+        joblib.dump(
+            self,
+            os.path.join(model_dir_path, PREDICTOR_FILE_NAME),
+            compress=0,
+            protocol=5,
+        )
 
     @classmethod
     def load(cls, model_dir_path: str) -> "Forecaster":
@@ -445,9 +680,12 @@ class Forecaster:
         Returns:
             Forecaster: A new instance of the loaded Forecaster.
         """
-        forecaster = joblib.load(os.path.join(model_dir_path, PREDICTOR_FILE_NAME))
+        forecaster = joblib.load(
+            os.path.join(model_dir_path, PREDICTOR_FILE_NAME), mmap_mode="r"
+        )
         model = RNNModel.load(os.path.join(model_dir_path, MODEL_FILE_NAME))
         forecaster.model = model
+        forecaster._compiled = False
         return forecaster
 
     def __str__(self):